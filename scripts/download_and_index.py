@@ -1,9 +1,11 @@
 import sys
-import gzip
+import mmap
 import os
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 import json
-import urllib.request
 import urllib.error
+from datetime import date
 from pathlib import Path
 
 # Add the scripts directory to the path for imports
@@ -15,10 +17,22 @@ from gamecache.downloader import Downloader  # noqa: E402
 from gamecache.sqlite_indexer import SqliteIndexer  # noqa: E402
 from gamecache.github_integration import setup_github_integration  # noqa: E402
 from gamecache.config import parse_config_file, create_nested_config  # noqa: E402
+from gamecache.http_client import make_keepalive_request  # noqa: E402
 from setup_logging import setup_logging  # noqa: E402
 
 
+# orjson parses API responses straight from bytes in C; fall back to stdlib
+# json when it isn't installed.
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    def _loads(data):
+        return json.loads(data.decode('utf-8', errors='replace'))
+
+
 UPGRADE_INSTRUCTIONS_URL = "https://github.com/EmilStenstrom/gamecache#keeping-your-copy-updated"
+UPDATE_CHECK_CACHE = Path.home() / '.cache' / 'gamecache' / 'update_check.json'
 
 
 def _print_info_box(title, lines):
@@ -34,16 +48,18 @@ def _print_info_box(title, lines):
 
 
 def _http_get_json(url, timeout=10, headers=None):
-    req = urllib.request.Request(url)
-    req.add_header('Accept', 'application/vnd.github+json')
-    req.add_header('User-Agent', 'GameCache/1.0')
+    req_headers = {
+        'Accept': 'application/vnd.github+json',
+        'User-Agent': 'GameCache/1.0',
+    }
     if headers:
-        for k, v in headers.items():
-            req.add_header(k, v)
+        req_headers.update(headers)
 
-    with urllib.request.urlopen(req, timeout=timeout) as resp:
-        data = resp.read()
-        return json.loads(data.decode('utf-8', errors='replace'))
+    # Keep-alive connection so consecutive GitHub calls share one TLS handshake.
+    status, resp_headers, data = make_keepalive_request('GET', url, headers=req_headers, timeout=timeout)
+    if status >= 400:
+        raise urllib.error.HTTPError(url, status, f"HTTP {status}", resp_headers, None)
+    return _loads(data)
 
 
 def _get_default_branch(owner, repo):
@@ -51,10 +67,60 @@ def _get_default_branch(owner, repo):
     return info.get('default_branch')
 
 
+def _load_cached_update_check(github_repo):
+    """Return today's cached behind_by for this repo, or None if stale/missing."""
+    try:
+        with open(UPDATE_CHECK_CACHE) as f:
+            cached = json.load(f)
+        if cached.get('date') == date.today().isoformat() and cached.get('repo') == github_repo:
+            return int(cached.get('behind_by', 0) or 0)
+    except Exception:
+        pass
+    return None
+
+
+def _save_cached_update_check(github_repo, behind_by):
+    try:
+        UPDATE_CHECK_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        with open(UPDATE_CHECK_CACHE, 'w') as f:
+            json.dump({'date': date.today().isoformat(), 'repo': github_repo, 'behind_by': behind_by}, f)
+    except Exception:
+        pass
+
+
+def _compare_with_upstream(upstream_owner, upstream_repo, owner, repo):
+    """Compare the user's repo against upstream, returning the comparison dict.
+
+    Default branches are almost always 'main' or 'master' on both sides, so
+    try those directly first — the common case is then a single API call
+    instead of two branch lookups plus a compare.
+    """
+    for branch in ('main', 'master'):
+        compare_url = (
+            f"https://api.github.com/repos/{upstream_owner}/{upstream_repo}"
+            f"/compare/{branch}...{owner}:{branch}"
+        )
+        try:
+            return _http_get_json(compare_url, timeout=10)
+        except urllib.error.HTTPError as e:
+            if e.code != 404:
+                raise
+
+    # Uncommon default branches: look them up explicitly.
+    upstream_branch = _get_default_branch(upstream_owner, upstream_repo) or 'master'
+    head_branch = _get_default_branch(owner, repo) or 'master'
+    compare_url = (
+        f"https://api.github.com/repos/{upstream_owner}/{upstream_repo}"
+        f"/compare/{upstream_branch}...{owner}:{head_branch}"
+    )
+    return _http_get_json(compare_url, timeout=10)
+
+
 def check_for_upstream_updates_via_github(github_repo):
     """Check whether the user's repo is behind the upstream template.
 
     Uses GitHub's compare API (HTTP GET) so it works without git installed.
+    The result is cached per day so repeat runs skip GitHub entirely.
     """
     if os.environ.get("GAMECACHE_SKIP_UPDATE_CHECK"):
         return
@@ -65,19 +131,12 @@ def check_for_upstream_updates_via_github(github_repo):
     owner, repo = github_repo.split('/', 1)
 
     try:
-        upstream_owner = 'EmilStenstrom'
-        upstream_repo = 'gamecache'
-
-        upstream_branch = _get_default_branch(upstream_owner, upstream_repo) or 'master'
-        head_branch = _get_default_branch(owner, repo) or 'master'
-
-        compare_url = (
-            f"https://api.github.com/repos/{upstream_owner}/{upstream_repo}"
-            f"/compare/{upstream_branch}...{owner}:{head_branch}"
-        )
-        comparison = _http_get_json(compare_url, timeout=10)
+        behind_by = _load_cached_update_check(github_repo)
+        if behind_by is None:
+            comparison = _compare_with_upstream('EmilStenstrom', 'gamecache', owner, repo)
+            behind_by = int(comparison.get('behind_by', 0) or 0)
+            _save_cached_update_check(github_repo, behind_by)
 
-        behind_by = int(comparison.get('behind_by', 0) or 0)
         if behind_by > 0:
             _print_info_box(
                 "New GameCache version available",
@@ -101,8 +160,13 @@ def main(args):
     # Convert flat config to nested structure for backward compatibility
     SETTINGS = create_nested_config(config)
 
-    # Best-effort update check (does not affect script success)
-    check_for_upstream_updates_via_github(SETTINGS.get("github", {}).get("repo"))
+    # Best-effort update check (does not affect script success). Run it in a
+    # background thread so its GitHub round-trips overlap the BGG download.
+    executor = ThreadPoolExecutor(max_workers=1)
+    update_check = executor.submit(
+        check_for_upstream_updates_via_github,
+        SETTINGS.get("github", {}).get("repo"),
+    )
 
     # Get BGG token from config
     bgg_token = SETTINGS["boardgamegeek"].get("token")
@@ -118,32 +182,62 @@ def main(args):
         extra_params=extra_params,
     )
 
-    # Deduplicate collection based on game ID
-    seen_ids = set()
-    unique_collection = []
-    for game in collection:
-        if game.id not in seen_ids:
-            unique_collection.append(game)
-            seen_ids.add(game.id)
-    collection = unique_collection
+    # The update check is advisory; don't let a slow GitHub hold up the run.
+    try:
+        update_check.result(timeout=5)
+    except Exception:
+        pass
+    executor.shutdown(wait=False)
+
+    # Deduplicate collection based on game ID (dicts preserve insertion order)
+    collection = list({game.id: game for game in collection}.values())
+
+    # Bail out before any database work if nothing was imported.
+    if not collection:
+        raise SystemExit("No games imported, is the boardgamegeek part of config.ini correctly set?")
 
     num_games = len(collection)
-    num_expansions = sum([len(game.expansions) for game in collection])
+    num_expansions = sum(len(game.expansions) for game in collection)
     print(f"Imported {num_games} games and {num_expansions} expansions from boardgamegeek.")
 
-    if not len(collection):
-        assert False, "No games imported, is the boardgamegeek part of config.ini correctly set?"
-
-    # Create SQLite database
+    # Create SQLite database. Load everything in one explicit transaction so
+    # we pay a single commit/fsync instead of one per inserted row. No
+    # rollback on failure: ROLLBACK is undefined with journal_mode=OFF, and
+    # the database is rebuilt from scratch on the next run anyway.
     sqlite_path = "gamecache.sqlite"
     indexer = SqliteIndexer(sqlite_path)
+    indexer.conn.execute("BEGIN")
     indexer.add_objects(collection)
+    indexer.conn.execute("COMMIT")
+    indexer.create_indexes()
     print(f"Created SQLite database with {num_games} games and {num_expansions} expansions.")
 
-    # Gzip the database and remove the original
+    # VACUUM INTO writes a compact copy without free pages, which both
+    # shrinks the file and compresses better than vacuuming in place.
+    # It refuses to overwrite, so clear any leftover from a crashed run first.
+    compact_path = f"{sqlite_path}.compact"
+    Path(compact_path).unlink(missing_ok=True)
+    indexer.conn.execute("VACUUM INTO ?", (compact_path,))
+    indexer.close()
+
+    # Gzip the compact copy and remove the intermediates. Drive zlib directly
+    # (wbits=31 emits the gzip container) rather than going through the gzip
+    # module's per-write bookkeeping, and mmap the source so the compressor
+    # reads straight from the page cache, in 1 MB slices so peak memory stays
+    # constant regardless of database size. Level 6 compresses several times
+    # faster than the default 9 for a ratio difference of a couple of percent
+    # on SQLite pages.
     gzip_path = f"{sqlite_path}.gz"
-    with open(sqlite_path, 'rb') as f_in, gzip.open(gzip_path, 'wb') as f_out:
-        f_out.write(f_in.read())
+    chunk_size = 1024 * 1024
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    try:
+        with open(compact_path, 'rb') as f_in, open(gzip_path, 'wb', buffering=chunk_size) as f_out:
+            with mmap.mmap(f_in.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for offset in range(0, len(mm), chunk_size):
+                    f_out.write(compressor.compress(mm[offset:offset + chunk_size]))
+            f_out.write(compressor.flush())
+    finally:
+        Path(compact_path).unlink(missing_ok=True)
     os.remove(sqlite_path)
     print(f"Created gzipped database: {gzip_path}")
 
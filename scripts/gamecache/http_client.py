@@ -6,12 +6,58 @@ Provides simple HTTP functionality with caching capabilities.
 import urllib.request
 import urllib.parse
 import urllib.error
+import http.client
 import json
 import sqlite3
 import hashlib
+import threading
 import time as time_module
 import gzip
 
+# Keep-alive connection pool: one persistent connection per scheme+host,
+# each guarded by a lock so concurrent callers don't interleave
+# request/response pairs on the same socket.
+_keepalive_connections = {}
+_keepalive_pool_lock = threading.Lock()
+
+
+def _get_keepalive_connection(scheme, host, timeout):
+    key = f"{scheme}://{host}"
+    with _keepalive_pool_lock:
+        entry = _keepalive_connections.get(key)
+        if entry is None:
+            conn_class = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+            entry = (conn_class(host, timeout=timeout), threading.Lock())
+            _keepalive_connections[key] = entry
+    return entry
+
+
+def make_keepalive_request(method, url, body=None, headers=None, timeout=30):
+    """HTTP request over a persistent per-host connection.
+
+    Returns (status, headers_dict, body_bytes) without raising on HTTP error
+    statuses. Reusing one connection per host amortizes the TCP+TLS handshake
+    across calls, which dominates latency for short API requests.
+    """
+    parsed = urllib.parse.urlsplit(url)
+    path = parsed.path or '/'
+    if parsed.query:
+        path += '?' + parsed.query
+
+    conn, conn_lock = _get_keepalive_connection(parsed.scheme, parsed.netloc, timeout)
+    with conn_lock:
+        for attempt in (0, 1):
+            try:
+                conn.request(method, path, body=body, headers=headers or {})
+                response = conn.getresponse()
+                data = response.read()
+                return response.status, dict(response.headers), data
+            except (http.client.HTTPException, ConnectionError, OSError):
+                # Stale keep-alive socket: reconnect and retry once.
+                conn.close()
+                if attempt:
+                    raise
+
 
 def make_http_request(url, params=None, timeout=30, headers=None):
     """Simple HTTP GET using urllib"""
@@ -6,10 +6,11 @@ Simple validation script to check if setup is correct before running the main sc
 import sys
 import re
 import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from importlib.metadata import distribution, PackageNotFoundError
 from pathlib import Path
 from urllib.parse import unquote
-import urllib.request
-import urllib.error
 
 # Add the scripts directory to the path so we can import gamecache modules
 script_dir = Path(__file__).parent
@@ -17,29 +18,39 @@ sys.path.insert(0, str(script_dir))
 
 # Now import after path is set
 from gamecache.config import parse_config_file  # noqa: E402
-from gamecache.http_client import make_http_request  # noqa: E402
+from gamecache.http_client import make_http_request, make_keepalive_request  # noqa: E402
+
+
+# Use orjson to decode API error bodies when available (it accepts bytes
+# directly); stdlib json otherwise.
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    def _loads(data):
+        return json.loads(data.decode('utf-8', errors='ignore'))
+
+
+# Compiled once at import; these run on every config validation.
+_GITHUB_URL_RE = re.compile(r'^(?:https?://)?(?:www\.)?github\.com/([^/]+)/([^/]+)$', re.IGNORECASE)
+# Reasonably strict (not perfect): GitHub user/org names are 1-39 chars,
+# alphanumeric or single hyphens between segments.
+_OWNER_RE = re.compile(r'[A-Za-z0-9](?:[A-Za-z0-9-]{0,37}[A-Za-z0-9])?')
+# Repo names can include dots/underscores.
+_REPO_RE = re.compile(r'[A-Za-z0-9._-]+')
 
 
 def _http_request(method, url, timeout=10, headers=None):
     """HTTP request helper that returns (status, headers, body_bytes).
 
-    Uses urllib directly so we can do HEAD requests and read error bodies.
+    Uses a keep-alive connection per host so the repeated GitHub API calls
+    share one TLS handshake, and still supports HEAD and error bodies.
     """
-    req = urllib.request.Request(url, method=method)
-    req.add_header('User-Agent', 'GameCache/1.0')
+    req_headers = {'User-Agent': 'GameCache/1.0'}
     if headers:
-        for k, v in headers.items():
-            req.add_header(k, v)
+        req_headers.update(headers)
 
-    try:
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            return resp.status, dict(resp.headers), resp.read()
-    except urllib.error.HTTPError as e:
-        try:
-            body = e.read()
-        except Exception:
-            body = b''
-        return e.code, dict(e.headers), body
+    return make_keepalive_request(method, url, headers=req_headers, timeout=timeout)
 
 
 def _decode_snippet(body, limit=300):
@@ -64,7 +75,7 @@ def _normalize_github_repo(raw_value):
 
     value = value.rstrip('/')
 
-    m = re.match(r'^(?:https?://)?(?:www\.)?github\.com/([^/]+)/([^/]+)$', value, re.IGNORECASE)
+    m = _GITHUB_URL_RE.match(value)
     if m:
         owner, repo = m.group(1), m.group(2)
         warnings.append("github_repo should be just 'owner/repo' (not a full URL)")
@@ -74,32 +85,28 @@ def _normalize_github_repo(raw_value):
 
 
 def _is_valid_github_owner(owner):
-    # Reasonably strict (not perfect): GitHub user/org names are 1-39 chars,
-    # alphanumeric or single hyphens between segments.
-    return re.fullmatch(r'[A-Za-z0-9](?:[A-Za-z0-9-]{0,37}[A-Za-z0-9])?', owner) is not None
+    return _OWNER_RE.fullmatch(owner) is not None
 
 
 def _is_valid_github_repo_name(repo):
-    # Repo names can include dots/underscores. Avoid path-ish patterns.
+    # Avoid path-ish patterns.
     if repo in {'.', '..'}:
         return False
     if '..' in repo:
         return False
     if '%' in repo:
         return False
-    return re.fullmatch(r'[A-Za-z0-9._-]+', repo) is not None
+    return _REPO_RE.fullmatch(repo) is not None
 
 
-def _validate_github_user(owner):
+def _validate_github_user(owner, response):
     """Validate that the GitHub user/organization exists.
-    
-    Returns True if the user exists, False otherwise.
+
+    Takes the already-fetched (status, headers, body) response for the user
+    API call. Returns True if the user exists, False otherwise.
     """
-    print(f"🔍 Checking GitHub user '{owner}' exists...")
-    api_url = f"https://api.github.com/users/{owner}"
-    req_headers = {'Accept': 'application/vnd.github+json'}
-    status, resp_headers, body = _http_request('GET', api_url, timeout=10, headers=req_headers)
-    
+    status, resp_headers, body = response
+
     if status == 200:
         print(f"✅ GitHub user '{owner}' exists")
         return True
@@ -110,7 +117,7 @@ def _validate_github_user(owner):
     elif status == 403:
         msg = ''
         try:
-            msg = json.loads(body.decode('utf-8', errors='ignore')).get('message', '')
+            msg = _loads(body).get('message', '')
         except Exception:
             msg = _decode_snippet(body)
         print(f"⚠️  GitHub API returned 403 when checking user (rate limit or access restriction)")
@@ -150,17 +157,34 @@ def validate_github_repo(repo_value):
 
     print(f"✅ GitHub repo format looks good: {normalized}")
 
+    # The three remaining checks are independent requests, so fire them all
+    # at once and consume the results (and print) in the original order.
+    # The two api.github.com calls share one keep-alive connection and so
+    # still serialize; the win is that the proxy HEAD overlaps them both.
+    # No context manager: its __exit__ would block early returns on the
+    # in-flight proxy request (up to its 20 s timeout).
+    req_headers = {'Accept': 'application/vnd.github+json'}
+    user_url = f"https://api.github.com/users/{owner}"
+    repo_url = f"https://api.github.com/repos/{owner}/{repo}"
+    proxy_url = f"https://cors-proxy.mybgg.workers.dev/{owner}/{repo}"
+    executor = ThreadPoolExecutor(max_workers=3)
+    user_future = executor.submit(_http_request, 'GET', user_url, 10, req_headers)
+    repo_future = executor.submit(_http_request, 'GET', repo_url, 10, req_headers)
+    proxy_future = executor.submit(_http_request, 'HEAD', proxy_url, 20)
+
     # First, validate that the GitHub user exists.
     # This makes an additional API call but provides clearer error messages
     # by distinguishing username typos from repository issues.
-    if not _validate_github_user(owner):
+    print(f"🔍 Checking GitHub user '{owner}' exists...")
+    if not _validate_github_user(owner, user_future.result()):
+        # Don't wait around for the other requests on the error path.
+        executor.shutdown(wait=False, cancel_futures=True)
         return False
 
     # Check repo exists (helps catch typos and private repos).
     print("🔍 Checking GitHub repo exists...")
-    api_url = f"https://api.github.com/repos/{owner}/{repo}"
-    req_headers = {'Accept': 'application/vnd.github+json'}
-    status, headers, body = _http_request('GET', api_url, timeout=10, headers=req_headers)
+    status, headers, body = repo_future.result()
+    executor.shutdown(wait=False)
 
     if status == 200:
         print("✅ GitHub repo is reachable")
@@ -174,7 +198,7 @@ def validate_github_repo(repo_value):
     elif status == 403:
         msg = ''
         try:
-            msg = json.loads(body.decode('utf-8', errors='ignore')).get('message', '')
+            msg = _loads(body).get('message', '')
         except Exception:
             msg = _decode_snippet(body)
         print(f"⚠️  GitHub API returned 403 (rate limit or access restriction)")
@@ -188,8 +212,7 @@ def validate_github_repo(repo_value):
 
     # Check the exact URL the website will fetch in production.
     print("🔍 Checking CORS proxy download endpoint...")
-    proxy_url = f"https://cors-proxy.mybgg.workers.dev/{owner}/{repo}"
-    status, _, body = _http_request('HEAD', proxy_url, timeout=20)
+    status, _, body = proxy_future.result()
     if status == 200:
         print("✅ CORS proxy can access your latest database release")
         return True
@@ -286,22 +309,24 @@ def validate_bgg_user(username):
         print("   Check your internet connection and BGG username")
         return False
 
+@lru_cache(maxsize=1)
+def _required_packages():
+    """Parse scripts/requirements.in once per process into a tuple of names."""
+    required_packages = []
+    for line in Path("scripts/requirements.in").read_text().splitlines():
+        line = line.strip()
+        # Skip empty lines and comments; strip version specifiers
+        if line and not line.startswith('#'):
+            required_packages.append(re.split(r'[<>=~]', line, maxsplit=1)[0].strip())
+    return tuple(required_packages)
+
+
 def validate_python_deps():
     """Check if required Python packages are installed"""
     print("🔍 Checking Python dependencies...")
 
-    # Read requirements from requirements.in file
-    requirements_path = Path("scripts/requirements.in")
     try:
-        with open(requirements_path) as f:
-            required_packages = []
-            for line in f:
-                line = line.strip()
-                # Skip empty lines and comments
-                if line and not line.startswith('#'):
-                    # Handle package names with version specifiers
-                    package_name = line.split('==')[0].split('>=')[0].split('<=')[0].split('~=')[0]
-                    required_packages.append(package_name.strip())
+        required_packages = _required_packages()
     except Exception as e:
         print(f"❌ Error reading requirements.in: {e}")
         print("   Make sure you run this from the GameCache directory")
@@ -309,22 +334,12 @@ def validate_python_deps():
 
     missing = []
     for package in required_packages:
+        # Check installed metadata instead of importing: distribution() is a
+        # filesystem lookup keyed by the pip name, so no pillow→PIL style
+        # mapping is needed and no module is actually loaded.
         try:
-            # Handle package names that import differently than their pip name
-            import_name = package
-
-            # Special cases for packages that import differently
-            if package == "pillow":
-                import_name = "PIL"
-            elif package == "pynacl":
-                import_name = "nacl"
-            elif "-" in package:
-                import_name = package.replace("-", "_")
-            elif "." in package:
-                import_name = package.replace(".", "_")
-
-            __import__(import_name)
-        except ImportError:
+            distribution(package)
+        except PackageNotFoundError:
             missing.append(package)
 
     if missing: